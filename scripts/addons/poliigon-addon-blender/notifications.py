@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .modules.poliigon_core import notifications
 from .modules.poliigon_core.updater import SoftwareUpdater, t2v
@@ -48,6 +48,38 @@ class Notification:
     # execution of some kind.
     ac_run_operator_ops_name: Optional[str] = None
 
+    # Button modes by (url, label), see ui.f_NotificationBanner()
+    mode_cache: Dict[Tuple[str, str], str] = field(
+        default_factory=dict, repr=False, compare=False)
+    # Operator properties, built on first use, see get_op_payload()
+    op_payload: Optional[Tuple[Tuple[str, Any], ...]] = field(
+        default=None, repr=False, compare=False)
+
+    def get_op_payload(self) -> Tuple[Tuple[str, Any], ...]:
+        """Returns (property, value) pairs to set on the notice's operator.
+
+        Only POPUP_MESSAGE and RUN_OPERATOR notices have an operator with
+        properties set from the notice.
+        """
+        if self.op_payload is not None:
+            return self.op_payload
+
+        payload = []
+        if self.action == self.ActionType.POPUP_MESSAGE:
+            payload.append(("message_body", self.ac_popup_message_body))
+            payload.append(("notice_id", self.notification_id))
+            if self.tooltip:
+                payload.append(("vTooltip", self.tooltip))
+            if self.ac_popup_message_url:
+                payload.append(("message_url", self.ac_popup_message_url))
+        elif self.action == self.ActionType.RUN_OPERATOR:
+            payload.append(("notice_id", self.notification_id))
+            payload.append(("ops_name", self.ac_run_operator_ops_name))
+            payload.append(("vTooltip", self.tooltip))
+
+        self.op_payload = tuple(payload)
+        return self.op_payload
+
 
 def build_update_notification(
         p4b_updater: SoftwareUpdater) -> Optional[Notification]:
@@ -1250,6 +1250,7 @@ class POLIIGON_OT_preview(Operator):
         # vMat = cTB.mat_import.f_BuildMat(
         #     self.vAsset, "PREVIEW", files, "Textures", self)
         self.vAData["files"] = files
+        cTB.set_file_flags(self.vAData)
         vMat = cTB.mat_import.import_material(
             asset_ref=self.vAData,
             asset_name=self.vAsset,  # only passed for legacy importer, not used in here
@@ -1784,6 +1785,9 @@ class POLIIGON_OT_show_quick_menu(Operator):
         if bpy.app.background:
             return {'CANCELLED'}  # Don't popup menus when running headless.
         asset_data = json.loads(self.asset_data_s)
+        # Derived flags are not serialized, see ui.draw_button_quick_menu()
+        cTB.set_file_flags(asset_data)
+        cTB.set_convention_flags(asset_data)
         sizes = self.vSizes.split(";") if self.vSizes else []
         ui.show_quick_menu(cTB,
                            asset_data_tab=asset_data,
@@ -3868,6 +3872,7 @@ class POLIIGON_OT_load_asset_size_from_list(bpy.types.Operator):
         asset_data["slug"] = self.asset_name
         asset_data["type"] = self.asset_type
         asset_data["files"] = files
+        cTB.set_file_flags(asset_data)
         asset_data["maps"] = maps
         asset_data["lods"] = lods
         asset_data["sizes"] = sizes
@@ -3883,6 +3888,7 @@ class POLIIGON_OT_load_asset_size_from_list(bpy.types.Operator):
         asset_data["url"] = ""
         asset_data["api_convention"] = self.convention
         asset_data["local_convention"] = self.convention
+        cTB.set_convention_flags(asset_data)
 
         with cTB.lock_assets:
             if self.asset_name in cTB.vAssets["poliigon"][self.asset_type]:
@@ -3895,6 +3901,8 @@ class POLIIGON_OT_load_asset_size_from_list(bpy.types.Operator):
             cTB.vAssets["local"][self.asset_type][self.asset_name] = asset_data
 
         cTB.vPurchased.append(self.asset_name)
+        cTB.vPurchasedSet.add(self.asset_name)
+        cTB.invalidate_draw_cache()
 
         # TODO(Andreas): If we wanted the imported asset to appear in UI,
         #                we'd need to fill this (not exactly easy...):
@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 
+from collections import OrderedDict
 from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
@@ -31,6 +32,7 @@ import json
 import mathutils
 import os
 import queue
+import sys
 import threading
 import time
 import traceback
@@ -145,6 +147,43 @@ def print_exc(fut: Future) -> None:
     traceback.print_tb(exc.__traceback__)
 
 
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+
+@lru_cache(maxsize=256)
+def wrap_label_text(text: str, width: float, ui_scale: float) -> Tuple[str]:
+    """Splits a text into lines, estimated to fit the given width.
+
+    Used by c_Toolbox.f_Label() on every redraw, thus cached.
+    """
+
+    words = [word.replace("!@#", " ") for word in text.split(" ")]
+
+    lines = []
+    line = ""
+    for word in words:
+        line_width = 15
+        line_new = line + word + " "
+        for char in line_new:
+            if char in "ABCDEFGHKLMNOPQRSTUVWXYZmw":
+                line_width += 9
+            elif char in "abcdeghknopqrstuvxyz0123456789":
+                line_width += 6
+            elif char in "IJfijl .":
+                line_width += 3
+
+        line_width *= ui_scale
+
+        if line_width > width:
+            lines.append(line)
+            line = word + " "
+        else:
+            line += word + " "
+
+    if line != "":
+        lines.append(line)
+    return tuple(lines)
+
+
 # ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
 
 class LoginStates(Enum):
@@ -233,6 +272,14 @@ class c_Toolbox:
     reporting_error_rate = None
     reporting_transaction_rate = None
 
+    # Datablock counts last seen by f_depsgraph_handler()
+    scene_data_signature = None
+
+    # Notification title paddings, (re)calculated with UI scale in check_dpi()
+    ui_scale_paddings = None
+    notice_padding_dismiss = 0.0
+    notice_padding_no_dismiss = 0.0
+
     def __init__(self, api_service=None):
         self.register_success = False
 
@@ -390,6 +437,8 @@ class c_Toolbox:
         # ......................................................................................
 
         # Separating UI icons from asset previews.
+        # Reloaded icons get new icon_ids, see ui._IconIds.
+        self.icon_ids_valid = False
         if self.vIcons is None:
             self.vIcons = bpy.utils.previews.new()
         else:
@@ -617,6 +666,9 @@ class c_Toolbox:
         self.vAssetsIndex["imported"] = {}
 
         self.vPurchased = []
+        # Companion of vPurchased for fast membership tests during draw,
+        # needs to be kept in sync on every change of vPurchased.
+        self.vPurchasedSet = set()
 
         # Dictionary storing last download settings per asset.
         # Used in UI drawing to modify Apply/Import button.
@@ -646,7 +698,21 @@ class c_Toolbox:
         self.purchase_queue = queue.Queue()
         self.purchase_threads = []
 
-        self.vPreviewsDownloading = []
+        self.vPreviewsDownloading = set()
+
+        # (key, (thumb_width, num_columns, padding)), see ui.py
+        self.grid_geometry_cache = (None, None)
+        # Derived per asset draw state, see ui.get_asset_draw_state().
+        # Entries are only valid for the generation and the very asset dict
+        # they got stored with. Least recently used entries get dropped.
+        self.draw_cache = OrderedDict()
+        self.draw_cache_gen = 0
+        # Same for ui.get_model_op_details(), keyed by
+        # (asset_name, asset_type, size, lod)
+        self.model_op_details_cache = OrderedDict()
+        # Names of all collections in blend file, None until needed after
+        # a scene update, see get_collection_names()
+        self.collection_names = None
 
         self.vGettingData = 1
         self.vWasWorking = False  # Identify if at last check, was still running.
@@ -1146,7 +1212,15 @@ class c_Toolbox:
         Used to ensure previews remain square and avoid text truncation.
         """
         prefs = bpy.context.preferences
-        self.vSettings["win_scale"] = prefs.system.ui_scale
+        ui_scale = prefs.system.ui_scale
+        self.vSettings["win_scale"] = ui_scale
+
+        if ui_scale != self.ui_scale_paddings:
+            self.ui_scale_paddings = ui_scale
+            # Empirically found squaring worked best for 1 & 2x displays,
+            # which accounts for the box+panel padding and the 'x' button.
+            self.notice_padding_dismiss = 32 * ui_scale
+            self.notice_padding_no_dismiss = 17 * ui_scale
 
     def get_ui_scale(self):
         """Utility for fetching the ui scale, used in draw code."""
@@ -1779,8 +1853,7 @@ class c_Toolbox:
                 # Thread either executing or done already
                 continue
             with self.lock_previews:
-                if asset_name in self.vPreviewsDownloading:
-                    self.vPreviewsDownloading.remove(asset_name)
+                self.vPreviewsDownloading.discard(asset_name)
 
     def enqueue_thumb_prefetch(self, asset_name: str):
         path_thumb = self.f_GetThumbnailPath(asset_name, 0)
@@ -1821,7 +1894,8 @@ class c_Toolbox:
 
         Return: bool on whether did load asset, false if skipped.
         """
-        vType = vA["type"].replace("HDRS", "HDRIs")
+        # Names and types get hashed a lot during UI draw, intern them
+        vType = sys.intern(vA["type"].replace("HDRS", "HDRIs"))
 
         if vType == "Substances":
             return False
@@ -1830,11 +1904,13 @@ class c_Toolbox:
             if vType not in self.vAssets[vArea].keys():
                 self.vAssets[vArea][vType] = {}
 
-        vName = vA["asset_name"]
+        vName = sys.intern(vA["asset_name"])
         asset_id = vA["id"]
 
-        if vArea == "my_assets" and vName not in self.vPurchased:
+        if vArea == "my_assets" and vName not in self.vPurchasedSet:
             self.vPurchased.append(vName)
+            self.vPurchasedSet.add(vName)
+            self.invalidate_draw_cache()
 
         # TODO(SOFT-539): Turn this into a dataclass structure to avoid keying.
         asset_data = {}
@@ -1844,6 +1920,7 @@ class c_Toolbox:
         asset_data["slug"] = vA["slug"]
         asset_data["type"] = vType
         asset_data["files"] = []
+        self.set_file_flags(asset_data)
         asset_data["maps"] = []
         asset_data["lods"] = []
         asset_data["sizes"] = []
@@ -1864,6 +1941,7 @@ class c_Toolbox:
             api_convention = 0
         asset_data["api_convention"] = api_convention
         asset_data["local_convention"] = None  # to be determined in build_local_asset_data
+        self.set_convention_flags(asset_data)
         if api_convention > SUPPORTED_CONVENTION:
             self.unsupported_assets_exist = True  # could be used for notification
 
@@ -2166,6 +2244,7 @@ class c_Toolbox:
         vDummy["slug"] = ""
         vDummy["type"] = ""
         vDummy["files"] = []
+        self.set_file_flags(vDummy)
         vDummy["maps"] = []
         vDummy["lods"] = []
         vDummy["sizes"] = []
@@ -2175,6 +2254,9 @@ class c_Toolbox:
         vDummy["categories"] = []
         vDummy["preview"] = ""
         vDummy["thumbnails"] = []
+        vDummy["api_convention"] = None
+        vDummy["local_convention"] = None
+        self.set_convention_flags(vDummy)
 
         for i in range(self.vSettings["page"]):
             vDummyAssets.append(vDummy)
@@ -2464,12 +2546,8 @@ class c_Toolbox:
                 "error")
 
         with self.lock_previews:
-            # Always remove from download queue (can have thread conflicts, so try)
-            try:
-                if vAsset in self.vPreviewsDownloading:
-                    self.vPreviewsDownloading.remove(vAsset)
-            except ValueError:  # Already removed.
-                pass
+            # Always remove from download queue (may have been removed already)
+            self.vPreviewsDownloading.discard(vAsset)
 
     # .........................................................................
 
@@ -2536,6 +2614,8 @@ class c_Toolbox:
             if req.ok:
                 # Append purchased if success, or if the asset is free.
                 self.vPurchased.append(asset)
+                self.vPurchasedSet.add(asset)
+                self.invalidate_draw_cache()
                 with self.lock_assets:
                     self.vAssets["my_assets"][asset_data["type"]][asset] = asset_data
 
@@ -2627,6 +2707,8 @@ class c_Toolbox:
         if icons_only is False:
             self.notifications = []
             self.vPurchased = []
+            self.vPurchasedSet = set()
+            self.invalidate_draw_cache()
 
             with self.lock_asset_index:
                 self.vAssetsIndex["poliigon"] = {}
@@ -2862,6 +2944,22 @@ class c_Toolbox:
             self.last_texture_size[asset_name] = size
         elif asset_name in self.last_texture_size:
             del self.last_texture_size[asset_name]
+        self.invalidate_draw_cache()
+
+    def get_collection_names(self) -> frozenset:
+        """Returns names of all collections, gathered once per scene update."""
+        if self.collection_names is None:
+            self.collection_names = frozenset(bpy.data.collections.keys())
+        return self.collection_names
+
+    def invalidate_draw_cache(self) -> None:
+        """Invalidates cached per asset draw state (see ui.py).
+
+        To be called whenever purchased, local or imported assets change.
+        Also drops the snapshot of collection names.
+        """
+        self.collection_names = None
+        self.draw_cache_gen += 1
 
     def get_last_downloaded_size(self,
                                  asset_name: str,
@@ -2874,6 +2972,7 @@ class c_Toolbox:
                                     ) -> None:
         if asset_name in self.last_texture_size:
             del self.last_texture_size[asset_name]
+            self.invalidate_draw_cache()
 
     def get_destination_library_directory(self,
                                           asset_data: Dict
@@ -3380,6 +3479,7 @@ class c_Toolbox:
             asset_name, asset_type, asset_files)
         with self.lock_assets:
             self.vAssets["local"][asset_type][asset_name] = asset_data
+        self.invalidate_draw_cache()
         self.print_debug(dbg, "update_asset_data DONE")
 
     @reporting.handle_function(silent=True)
@@ -3860,6 +3960,7 @@ class c_Toolbox:
         with self.lock_assets:
             for vType in self.vAssetTypes:
                 self.vAssets["local"][vType] = {}
+        self.invalidate_draw_cache()
 
         vGetAssets = {}
         vModels = []
@@ -3994,6 +4095,7 @@ class c_Toolbox:
                     self.vAssets["local"][vType] = {}
                 # updating global asset dict here for better UI responsiveness
                 self.vAssets["local"][vType][vA] = asset_data
+            self.invalidate_draw_cache()
 
         vSLatest = {}
         for vK in gLatest.keys():
@@ -4024,6 +4126,32 @@ class c_Toolbox:
             files_existing.append(file)
         return files_existing
 
+    @staticmethod
+    def set_file_flags(asset_data: Dict) -> None:
+        """Stores the set of file extensions present in asset's files.
+
+        Asset browser blend files (_LIB.blend) are not taken into account.
+        Spares the UI from scanning all files of an asset on every redraw.
+        Extensions keep their case, like the endswith() checks in the UI
+        did before, so e.g. ".BLEND" does not count as ".blend".
+        """
+        asset_data["exts"] = frozenset(
+            os.path.splitext(path)[1]
+            for path in asset_data["files"]
+            if "_LIB.blend" not in path)
+
+    @staticmethod
+    def set_convention_flags(asset_data: Dict) -> None:
+        """Stores whether API and local conventions are supported.
+
+        Needs to be called, whenever one of the conventions changes.
+        """
+        for key in ["api", "local"]:
+            convention = asset_data[f"{key}_convention"]
+            asset_data[f"_supported_{key}"] = (
+                convention is not None
+                and convention <= SUPPORTED_CONVENTION)
+
     def build_local_asset_data(self, asset, type, files):
         """Builds data dict for asset"""
 
@@ -4069,15 +4197,16 @@ class c_Toolbox:
                 vars += [var for var in self.vVars if var in filename_parts]
 
         asset_data = {}
-        asset_data["name"] = asset
+        asset_data["name"] = sys.intern(asset)
         # asset_data["id"] = 0  # Don't populate id, it's not available here.
-        asset_data["type"] = type
+        asset_data["type"] = sys.intern(type)
         if file_asset_browser is not None:
             files_existing.remove(file_asset_browser)
             asset_data["in_asset_browser"] = True
         else:
             asset_data["in_asset_browser"] = False
         asset_data["files"] = files_existing
+        self.set_file_flags(asset_data)
         asset_data["maps"] = sorted(list(set(maps)))
         asset_data["lods"] = [lod for lod in self.vLODs if lod in lods]  # TODO: sort
         asset_data["sizes"] = [size for size in SIZES if size in sizes]  # TODO: sort
@@ -4115,6 +4244,7 @@ class c_Toolbox:
 
                 if vType == "Textures" and vAsset != "":
                     self.print_debug(dbg, "f_GetSceneAssets", vAsset)
+                    vAsset = sys.intern(vAsset)
 
                     if vAsset not in vImportedAssets["Textures"].keys():
                         vImportedAssets["Textures"][vAsset] = []
@@ -4130,6 +4260,7 @@ class c_Toolbox:
                 vAsset = vAsset.split("_")[0]
                 if vType == "Models" and vAsset != "":
                     self.print_debug(dbg, "f_GetSceneAssets", vAsset)
+                    vAsset = sys.intern(vAsset)
 
                     if vAsset not in vImportedAssets["Models"].keys():
                         vImportedAssets["Models"][vAsset] = []
@@ -4145,6 +4276,7 @@ class c_Toolbox:
                 vAsset = vAsset.split("_")[0]
                 if vType in ["HDRIs", "Brushes"] and vAsset != "":
                     self.print_debug(dbg, "f_GetSceneAssets", vAsset)
+                    vAsset = sys.intern(vAsset)
 
                     if vAsset not in vImportedAssets[vType].keys():
                         vImportedAssets[vType][vAsset] = []
@@ -4154,6 +4286,7 @@ class c_Toolbox:
                 pass
 
         self.imported_assets = vImportedAssets
+        self.invalidate_draw_cache()
 
     def f_GetActiveData(self):
         dbg = 0
@@ -4363,58 +4496,25 @@ class c_Toolbox:
         dbg = 0
         self.print_separator(dbg, "f_Label")
 
-        vWords = [vW.replace("!@#", " ") for vW in vText.split(" ")]
         vContainerRow = vContainer.row()
         vParent = vContainerRow.column(align=True)
         vParent.scale_y = 0.8  # To make vertical height more natural for text.
         if vAddPadding:
             vParent.label(text="")
 
+        ui_scale = self.get_ui_scale()
         if vIcon:
-            vWidth -= 25 * self.get_ui_scale()
-
-        vLine = ""
-        vFirst = True
-        for vW in vWords:
-            vLW = 15
-            vLineN = vLine + vW + " "
-            for vC in vLineN:
-                if vC in "ABCDEFGHKLMNOPQRSTUVWXYZmw":
-                    vLW += 9
-                elif vC in "abcdeghknopqrstuvxyz0123456789":
-                    vLW += 6
-                elif vC in "IJfijl .":
-                    vLW += 3
-
-            vLW *= self.get_ui_scale()
-
-            if vLW > vWidth:
-                if vFirst:
-                    if vIcon is None:
-                        vParent.label(text=vLine)
-                    else:
-                        vParent.label(text=vLine, icon=vIcon)
-                    vFirst = False
-
-                else:
-                    if vIcon is None:
-                        vParent.label(text=vLine)
-                    else:
-                        vParent.label(text=vLine, icon="BLANK1")
+            vWidth -= 25 * ui_scale
 
-                vLine = vW + " "
-
-            else:
-                vLine += vW + " "
-
-        if vLine != "":
+        # Wrapping is the same on every redraw, only the labels get drawn
+        lines = wrap_label_text(vText, vWidth, ui_scale)
+        for idx_line, vLine in enumerate(lines):
             if vIcon is None:
                 vParent.label(text=vLine)
+            elif idx_line == 0:
+                vParent.label(text=vLine, icon=vIcon)
             else:
-                if vFirst:
-                    vParent.label(text=vLine, icon=vIcon)
-                else:
-                    vParent.label(text=vLine, icon="BLANK1")
+                vParent.label(text=vLine, icon="BLANK1")
         if vAddPadding:
             vParent.label(text="")
 
@@ -4484,7 +4584,7 @@ class c_Toolbox:
 
         with self.lock_previews:
             if vAsset not in self.vPreviewsDownloading:
-                self.vPreviewsDownloading.append(vAsset)
+                self.vPreviewsDownloading.add(vAsset)
                 self.f_QueuePreview(vAsset, index)
 
         return None
@@ -4505,8 +4605,9 @@ class c_Toolbox:
         return vSize
 
     def f_GetSize(self, vName):
+        name_parts = vName.split('_')
         for vSz in SIZES:
-            if vSz in vName.split('_'):
+            if vSz in name_parts:
                 return vSz
 
         return None
@@ -4854,6 +4955,32 @@ def f_load_handler(*args):
         cTB.f_GetSceneAssets()
 
 
+@persistent
+def f_depsgraph_handler(*args):
+    """Runs after scene changes, e.g. imported objects may have been deleted.
+
+    Invalidates cached draw state only, if datablocks got added or removed
+    or collections changed (e.g. renamed), not on every transform step or
+    playback frame.
+    """
+    data = bpy.data
+    signature = (len(data.objects),
+                 len(data.collections),
+                 len(data.materials),
+                 len(data.images))  # imported HDRIs and Brushes
+    depsgraph = args[1] if len(args) > 1 else None
+    collections_updated = (depsgraph is not None
+                           and depsgraph.id_type_updated("COLLECTION"))
+    if signature == cTB.scene_data_signature and not collections_updated:
+        return
+    cTB.scene_data_signature = signature
+
+    if cTB.vRunning:
+        cTB.invalidate_draw_cache()
+    else:
+        cTB.collection_names = None
+
+
 def f_login_with_website_handler() -> float:
     next_time_tick_s = None
     if cTB.login_state == LoginStates.IDLE:
@@ -5020,6 +5147,9 @@ def register(bl_info):
     if f_load_handler not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(f_load_handler)
 
+    if f_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(f_depsgraph_handler)
+
 
 def unregister():
     cTB.quitting = True
@@ -5037,6 +5167,9 @@ def unregister():
     if f_load_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(f_load_handler)
 
+    if f_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(f_depsgraph_handler)
+
     cTB.vRunning = 0
 
     # Don't block unregister or closing blender.
@@ -16,10 +16,12 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, partial
 import json
 from math import ceil
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import os
 import platform
 import re
@@ -33,10 +35,31 @@ from .notifications import Notification
 from .toolbox import (cTB,
                       DisplayError,
                       f_login_with_website_handler,
-                      ERR_LOGIN_TIMEOUT,
-                      SUPPORTED_CONVENTION)
+                      ERR_LOGIN_TIMEOUT)
 from . import utils
 
+# Blender version never changes during a session
+_SUPPORTS_MOSAIC = bpy.app.version >= (2, 90)
+
+# Size of an imported HDRI, determined from the light image's filename
+_HDRI_SIZE_RE = re.compile(r"_(\d+K)[_\.]")
+
+# Max. number of assets with cached draw state, see get_asset_draw_state()
+DRAW_CACHE_SIZE = 512
+
+# Notification action types, compared per notice on every redraw
+_ACTION_OPEN_URL = Notification.ActionType.OPEN_URL
+_ACTION_UPDATE_READY = Notification.ActionType.UPDATE_READY
+_ACTION_POPUP = Notification.ActionType.POPUP_MESSAGE
+_ACTION_RUN_OP = Notification.ActionType.RUN_OPERATOR
+
+# Notifications with unknown action type already reported,
+# see f_NotificationBanner()
+_notice_ids_invalid_reported = set()
+
+# Formatted size labels, e.g. "2K (download)", keyed by (size, action)
+_SIZE_LABELS = {}
+
 THUMB_SIZE_FACTOR = {"Tiny": 0.5,
                      "Small": 0.75,
                      "Medium": 1.0,
@@ -44,6 +67,36 @@ THUMB_SIZE_FACTOR = {"Tiny": 0.5,
                      "Huge": 2.0}
 
 
+class _IconIds:
+    """icon_ids of frequently drawn UI icons, resolved once from cTB.vIcons.
+
+    c_Toolbox.register() reloads the icons and marks the resolved ids
+    invalid via cTB.icon_ids_valid.
+    """
+
+    NAMES = ("GET_preview",
+             "NO_preview",
+             "ICON_acquired_check",
+             "ICON_dots",
+             "ICON_poliigon",
+             "ICON_myassets")
+
+    GET_preview = 0
+    NO_preview = 0
+    ICON_acquired_check = 0
+    ICON_dots = 0
+    ICON_poliigon = 0
+    ICON_myassets = 0
+
+    @classmethod
+    def ensure_loaded(cls) -> None:
+        if cTB.icon_ids_valid:
+            return
+        for name in cls.NAMES:
+            setattr(cls, name, cTB.vIcons[name].icon_id)
+        cTB.icon_ids_valid = True
+
+
 def safe_size_apply(op_ref: bpy.types.OperatorProperties,
                     size_value: str,
                     asset_name: str) -> None:
@@ -85,6 +138,8 @@ def f_BuildUI(vUI, vContext):
     cTB.vUI = vUI
     cTB.vContext = vContext
 
+    _IconIds.ensure_loaded()
+
     if len(cTB.imported_assets.keys()) == 0:
         cTB.f_GetSceneAssets()
 
@@ -828,7 +883,7 @@ def f_BuildAreas(cTB):
     vOp = vCol.operator(
         "poliigon.poliigon_setting",
         text="",
-        icon_value=cTB.vIcons["ICON_poliigon"].icon_id,
+        icon_value=_IconIds.ICON_poliigon,
         depress=vDep1 and vDep,
     )
     vOp.vMode = "area_poliigon"
@@ -839,7 +894,7 @@ def f_BuildAreas(cTB):
     vOp = vCol.operator(
         "poliigon.poliigon_setting",
         text="",
-        icon_value=cTB.vIcons["ICON_myassets"].icon_id,
+        icon_value=_IconIds.ICON_myassets,
         depress=vDep1 and vDep,
     )
     vOp.vMode = "area_my_assets"
@@ -967,14 +1022,15 @@ def determine_downloaded(asset_data: Dict) -> bool:
     asset_name = asset_data["name"]
     asset_type = asset_data["type"]
     asset_files = asset_data["files"]
+    asset_exts = asset_data["exts"]
 
     with cTB.lock_assets:
         assets_local = cTB.vAssets["local"]
 
-        if asset_type not in assets_local.keys():
+        if asset_type not in assets_local:
             return False
 
-        if asset_name not in assets_local[asset_type].keys():
+        if asset_name not in assets_local[asset_type]:
             return False
 
     is_downloaded = False
@@ -982,34 +1038,31 @@ def determine_downloaded(asset_data: Dict) -> bool:
     if asset_type == "Models" and prefer_blend:
         # Force display needing blend download, if prefer blend
         # active and e.g. only FBX local.
-        for path_asset in asset_files:
-            is_blend = path_asset.endswith(".blend")
-            is_asset_browser = "_LIB.blend" in path_asset
-            if is_blend and not is_asset_browser:
-                is_downloaded = True
-                break
+        is_downloaded = ".blend" in asset_exts
     elif asset_type == "Models" and not prefer_blend:
         # Force display needing FBX download, if prefer blend
         # active and e.g. only blend local.
-        for path_asset in asset_files:
-            is_fbx = path_asset.endswith(".fbx")
-            if is_fbx:
-                is_downloaded = True
-                break
+        is_downloaded = ".fbx" in asset_exts
     elif asset_type == "HDRIs":
         # Force button to show "download", if the preferred size(s)
         # are not available locally
+        basename = os.path.basename  # local alias, used per file and tile
+        size_exr = cTB.vSettings["hdri"]
+        size_jpg = cTB.vSettings["hdrib"]
+        use_jpg = cTB.vSettings["hdri_use_jpg_bg"]
         exr_is_local = False
+        jpg_is_local = False
         for path_asset in asset_files:
-            filename = os.path.basename(path_asset)
+            filename = basename(path_asset)
+            if not filename.endswith((".exr", ".jpg")):
+                continue
             if filename.endswith(".exr"):
-                exr_is_local |= cTB.vSettings["hdri"] in filename
-        if cTB.vSettings["hdri_use_jpg_bg"]:
-            jpg_is_local = False
-            for path_asset in asset_files:
-                filename = os.path.basename(path_asset)
-                if filename.endswith(".jpg") and "_JPG" in filename:
-                    jpg_is_local |= cTB.vSettings["hdrib"] in filename
+                exr_is_local |= size_exr in filename
+            elif use_jpg and "_JPG" in filename:
+                jpg_is_local |= size_jpg in filename
+            if exr_is_local and (jpg_is_local or not use_jpg):
+                break
+        if use_jpg:
             is_downloaded = exr_is_local and jpg_is_local
         else:
             is_downloaded = exr_is_local
@@ -1039,23 +1092,44 @@ def build_assets_no_assets(area: str, category: str) -> None:
     return box_not_found
 
 
-def build_assets_prepare_grid(thumb_size_factor: float,
-                              sorted_assets: List[Dict]
-                              ) -> Tuple[bpy.types.UILayout, float, int]:
+def calc_grid_geometry(width: float,
+                       thumb_size_factor: float,
+                       ui_scale: float,
+                       num_assets: int
+                       ) -> Tuple[float, int, float]:
+    """Returns thumb width, number of columns and padding of the asset grid."""
+
     thumb_width = 170
     thumb_width = ceil(thumb_width * thumb_size_factor)
-    thumb_width *= cTB.get_ui_scale()
+    thumb_width *= ui_scale
 
-    num_columns = int(cTB.vWidth / thumb_width)
+    num_columns = int(width / thumb_width)
     if num_columns == 0:
         num_columns = 1
-    if num_columns > len(sorted_assets):
-        num_columns = len(sorted_assets)
+    if num_columns > num_assets:
+        num_columns = num_assets
 
-    padding = (cTB.vWidth - (num_columns * thumb_width)) / 2
+    padding = (width - (num_columns * thumb_width)) / 2
     if padding < 1.0 and num_columns > 1:
         num_columns -= 1
-        padding = (cTB.vWidth - (num_columns * thumb_width)) / 2
+        padding = (width - (num_columns * thumb_width)) / 2
+    return thumb_width, num_columns, padding
+
+
+def build_assets_prepare_grid(thumb_size_factor: float,
+                              sorted_assets: List[Dict]
+                              ) -> Tuple[bpy.types.UILayout, float, int]:
+    # Geometry only changes with panel width, thumb size or UI scale
+    key_geometry = (cTB.vWidth,
+                    thumb_size_factor,
+                    cTB.get_ui_scale(),
+                    len(sorted_assets))
+    if cTB.grid_geometry_cache[0] == key_geometry:
+        thumb_width, num_columns, padding = cTB.grid_geometry_cache[1]
+    else:
+        thumb_width, num_columns, padding = calc_grid_geometry(*key_geometry)
+        cTB.grid_geometry_cache = (
+            key_geometry, (thumb_width, num_columns, padding))
 
     if padding < 1.0 or thumb_width + 1 > cTB.vWidth:
         # Panel is narrower than a single preview width, single col.
@@ -1106,9 +1180,9 @@ def get_local_sizes(asset_data: Dict) -> List[str]:
     with cTB.lock_assets:
         assets_local = cTB.vAssets["local"]
 
-        if asset_type in assets_local.keys():
+        if asset_type in assets_local:
             assets_local_by_type = assets_local[asset_type]
-            if asset_name in assets_local_by_type.keys():
+            if asset_name in assets_local_by_type:
                 asset_data_local = assets_local_by_type[asset_name]
 
                 for key in ["files", "lods"]:
@@ -1119,6 +1193,22 @@ def get_local_sizes(asset_data: Dict) -> List[str]:
     return sizes_local
 
 
+@lru_cache(maxsize=1024)
+def _closest_size_cached(sizes: Tuple[str], size_target: str) -> str:
+    """Cached variant of f_GetClosestSize(), sizes need to be a tuple."""
+    return cTB.f_GetClosestSize(sizes, size_target)
+
+
+def _size_label(size: str, action: str) -> str:
+    """Returns a size label like "2K (download)", formatted only once."""
+    key = (size, action)
+    label = _SIZE_LABELS.get(key)
+    if label is None:
+        label = f"{size} ({action})"
+        _SIZE_LABELS[key] = label
+    return label
+
+
 def determine_default_size(asset_data: Dict,
                            asset_sizes_local: List[str],
                            is_downloaded: bool
@@ -1128,24 +1218,25 @@ def determine_default_size(asset_data: Dict,
     asset_type = asset_data["type"]
 
     sizes_check = asset_data["sizes"]
-    if len(asset_sizes_local):
+    if asset_sizes_local:
         sizes_check = asset_sizes_local
 
-    if len(sizes_check):
+    if sizes_check:
+        sizes_check = tuple(sizes_check)
         if asset_type == "Textures":
-            size_default = cTB.f_GetClosestSize(sizes_check,
+            size_default = _closest_size_cached(sizes_check,
                                                 cTB.vSettings["res"])
         elif asset_type == "Models":
-            size_default = cTB.f_GetClosestSize(sizes_check,
+            size_default = _closest_size_cached(sizes_check,
                                                 cTB.vSettings["mres"])
         elif asset_type == "HDRIs":
             if is_downloaded:
-                size_default = cTB.f_GetClosestSize(sizes_check,
+                size_default = _closest_size_cached(sizes_check,
                                                     cTB.vSettings["hdri"])
             else:
                 size_default = cTB.vSettings["hdri"]
         elif asset_type == "Brushes":
-            size_default = cTB.f_GetClosestSize(sizes_check,
+            size_default = _closest_size_cached(sizes_check,
                                                 cTB.vSettings["brush"])
     return size_default
 
@@ -1157,26 +1248,28 @@ def determine_in_scene_sizes(asset_data: Dict,
     asset_type = asset_data["type"]
 
     sizes_in_scene = []
-    if asset_type not in cTB.imported_assets.keys():
+    if asset_type not in cTB.imported_assets:
         return sizes_in_scene, size_default
 
-    if asset_name not in cTB.imported_assets[asset_type].keys():
+    if asset_name not in cTB.imported_assets[asset_type]:
         return sizes_in_scene, size_default
 
     objlist = cTB.imported_assets[asset_type][asset_name]
-    idxs_remove_object = []
-    for idx_obj, obj in enumerate(objlist):
+    objs_kept = []
+    for obj in objlist:
         try:
             sizes_in_scene.append(cTB.f_GetSize(obj.name))
+            objs_kept.append(obj)
         except ReferenceError:
-            # Object was removed, so pop from the list (see below).
-            idxs_remove_object.append(idx_obj)
+            # Object was removed, so drop it from the list (see below).
+            pass
         except AttributeError as err:
             print("Failed to vInScene.append")
             print(err)
             # But continue to avoid complete UI breakage.
-    for idx_obj in reversed(idxs_remove_object):
-        objlist.pop(idx_obj)
+            objs_kept.append(obj)
+    if len(objs_kept) != len(objlist):
+        objlist[:] = objs_kept
 
     if sizes_in_scene and size_default not in sizes_in_scene and sizes_in_scene[0]:
         size_default = sizes_in_scene[0]
@@ -1184,6 +1277,72 @@ def determine_in_scene_sizes(asset_data: Dict,
     return sizes_in_scene, size_default
 
 
+def get_draw_state_settings() -> Tuple:
+    """Returns the settings the cached per asset draw state depends on."""
+    settings = cTB.vSettings
+    return (settings["res"],
+            settings["mres"],
+            settings["hdri"],
+            settings["hdrib"],
+            settings["brush"],
+            settings["hdri_use_jpg_bg"],
+            settings["download_prefer_blend"])
+
+
+def get_asset_draw_state(asset_data: Dict,
+                         area: str,
+                         key_settings: Tuple
+                         ) -> Tuple[bool, bool, List[str], str, bool]:
+    """Returns state derived from asset data needed to draw a grid cell.
+
+    Cached per asset in cTB.draw_cache, until either the cache generation
+    (see cTB.invalidate_draw_cache()) or one of the settings changes.
+    Asset data gets replaced, never modified, when an asset changes.
+    So a different asset dict also invalidates the entry.
+
+    Return value:
+    Tuple (is_backplate, is_downloaded, sizes_in_scene, size_default,
+           is_supported)
+    """
+
+    asset_name = asset_data["name"]
+    key_asset = (area, asset_data["type"], asset_name)
+    # Read generation upfront, changes during below calculation will
+    # invalidate the stored entry.
+    generation = cTB.draw_cache_gen
+    draw_cache = cTB.draw_cache
+    entry = draw_cache.get(key_asset)
+    if entry is not None:
+        entry_generation, entry_settings, entry_asset_data, state = entry
+        if (entry_generation == generation
+                and entry_settings == key_settings
+                and entry_asset_data is asset_data):
+            draw_cache.move_to_end(key_asset)
+            return state
+
+    asset_sizes_local = get_local_sizes(asset_data)
+    is_backplate = cTB.check_backplate(asset_name)
+    is_downloaded = determine_downloaded(asset_data)
+    size_default = determine_default_size(
+        asset_data, asset_sizes_local, is_downloaded)
+    sizes_in_scene, size_default = determine_in_scene_sizes(
+        asset_data, size_default)
+    size_default = cTB.get_last_downloaded_size(asset_name, size_default)
+    # Assets in imported area are local ones, without API convention
+    is_supported = area == "imported" or check_convention(asset_data)
+
+    state = (is_backplate,
+             is_downloaded,
+             sizes_in_scene,
+             size_default,
+             is_supported)
+    draw_cache[key_asset] = (generation, key_settings, asset_data, state)
+    draw_cache.move_to_end(key_asset)
+    while len(draw_cache) > DRAW_CACHE_SIZE:
+        draw_cache.popitem(last=False)
+    return state
+
+
 def draw_thumbnail(asset_data: Dict,
                    thumb_size_factor: float,
                    layout_box: bpy.types.UILayout) -> None:
@@ -1191,30 +1350,24 @@ def draw_thumbnail(asset_data: Dict,
     thumb_scale = cTB.vSettings["preview_size"] * thumb_size_factor
 
     with cTB.lock_previews:
-        if asset_name == "dummy":
-            layout_box.template_icon(
-                icon_value=cTB.vIcons["GET_preview"].icon_id,
-                scale=thumb_scale
-            )
-        elif asset_name in cTB.vPreviews.keys():
+        if asset_name in cTB.vPreviews:
             layout_box.template_icon(
                 icon_value=cTB.vPreviews[asset_name].icon_id,
                 scale=thumb_scale
             )
 
-            if asset_name in cTB.vPreviewsDownloading:
-                cTB.vPreviewsDownloading.remove(asset_name)
+            cTB.vPreviewsDownloading.discard(asset_name)
 
         else:
             if asset_name in cTB.vPreviewsDownloading:
                 layout_box.template_icon(
-                    icon_value=cTB.vIcons["GET_preview"].icon_id,
+                    icon_value=_IconIds.GET_preview,
                     scale=thumb_scale
                 )
 
             else:
                 layout_box.template_icon(
-                    icon_value=cTB.vIcons["NO_preview"].icon_id,
+                    icon_value=_IconIds.NO_preview,
                     scale=thumb_scale
                 )
 
@@ -1224,6 +1377,30 @@ def draw_thumb_state_asset_dummy(layout_row: bpy.types.UILayout) -> None:
     op.vMode = "none"
 
 
+def draw_cell_dummy(layout_grid: bpy.types.UILayout,
+                    thumb_size_factor: float) -> None:
+    """Draws a placeholder cell, while a page's assets are still fetched.
+
+    Skips the preview lookup and draw state of regular cells.
+    """
+    cell = layout_grid.column(align=True)
+    box_thumb = cell.box().column()
+
+    name_row = box_thumb.row(align=True)
+    name_row.label(text="")
+    name_row.scale_y = 0.8
+
+    box_thumb.template_icon(
+        icon_value=_IconIds.GET_preview,
+        scale=cTB.vSettings["preview_size"] * thumb_size_factor
+    )
+
+    row = cell.row(align=True)
+    draw_thumb_state_asset_dummy(row)
+
+    cell.separator()
+
+
 def draw_thumb_state_asset_purchasing(layout_row: bpy.types.UILayout) -> None:
     op = layout_row.operator(
         "poliigon.poliigon_setting",
@@ -1242,42 +1419,12 @@ def draw_thumb_state_asset_downloading(layout_row: bpy.types.UILayout,
     asset_id = asset_data["id"]
     asset_name = asset_data["name"]
 
+    # Only read what's needed, instead of copying the entire queue entry
     with cTB.lock_download:
-        download_data = cTB.vDownloadQueue[asset_id].copy()
-
-    download_file = download_data.get("download_file", "")
-    remaining_time = None
-    if os.path.exists(download_file):
-        if download_data.get("download_size") is not None:
-            download_size = download_data["download_size"]
-            try:
-                file_size = os.path.getsize(download_file)
-                time_file = os.path.getctime(download_file)
-            except BaseException as e:  # any exception
-                # As the file existed two lines above and now it's gone,
-                # we assume it is complete
-                print(e)
-                file_size = download_size
-                # any time is good, will be multiplied by zero anyway
-                time_file = time.time()
-            if file_size > 0:
-                download_time = time.time() - time_file
-                remaining_time = (download_time / file_size) * (download_size - file_size)
-
-                if remaining_time > 60 * 60:
-                    gm_remaining_time = time.gmtime(remaining_time)
-                    hours = int(time.strftime("%H", gm_remaining_time))
-                    remaining_time = f"{hours}h+"
-                elif remaining_time > 60:
-                    gm_remaining_time = time.gmtime(remaining_time)
-                    minutes = int(time.strftime("%M", gm_remaining_time))
-                    remaining_time = f"{minutes}m+"
-                elif remaining_time <= 60:
-                    gm_remaining_time = time.gmtime(remaining_time)
-                    seconds = int(time.strftime("%S", gm_remaining_time))
-                    remaining_time = f"{seconds}s"
-
-    progress = download_data.get("download_percent", 0.001)  # zero is not a good value for the row.split
+        download_data = cTB.vDownloadQueue[asset_id]
+        # zero is not a good value for the row.split
+        progress = download_data.get("download_percent", 0.001)
+        size_label = download_data.get("size", "")
 
     layout_row.label(text="", icon="IMPORT")
 
@@ -1297,7 +1444,7 @@ def draw_thumb_state_asset_downloading(layout_row: bpy.types.UILayout,
 
     split_progress = row_progress.split(factor=progress, align=True)
     pcent = round(progress * 100, 1)
-    tooltip = f"Downloading ({pcent}%)\n{asset_name} @ {download_data['size']}..."
+    tooltip = f"Downloading ({pcent}%)\n{asset_name} @ {size_label}..."
 
     op = split_progress.operator(
         "poliigon.poliigon_setting", text="", emboss=1, depress=1
@@ -1315,14 +1462,10 @@ def draw_thumb_state_asset_downloading(layout_row: bpy.types.UILayout,
 
 
 def check_convention(asset_data: Dict, local: bool = False) -> bool:
+    # Flags get precomputed by cTB.set_convention_flags()
     if local:
-        convention = asset_data["local_convention"]
-    else:
-        convention = asset_data["api_convention"]
-
-    if convention is not None and convention <= SUPPORTED_CONVENTION:
-        return True
-    return False
+        return asset_data["_supported_local"]
+    return asset_data["_supported_api"]
 
 
 def draw_thumb_state_asset_downloading_quick_preview(
@@ -1382,7 +1525,7 @@ def draw_button_quick_preview(layout_row: bpy.types.UILayout,
     do_show = False
     if is_backplate and asset_data["preview"] != "":
         do_show = True
-    elif len(asset_data["quick_preview"]):
+    elif asset_data["quick_preview"]:
         do_show = True
 
     if not do_show:
@@ -1408,7 +1551,7 @@ def draw_button_quick_preview(layout_row: bpy.types.UILayout,
 def draw_checkmark_imported(layout_row: bpy.types.UILayout) -> None:
     col_checkmark = layout_row.column(align=True)
     col_checkmark.enabled = False
-    icon_val = cTB.vIcons["ICON_acquired_check"].icon_id
+    icon_val = _IconIds.ICON_acquired_check
     op = col_checkmark.operator(
         "poliigon.poliigon_setting",
         text="",
@@ -1419,6 +1562,25 @@ def draw_checkmark_imported(layout_row: bpy.types.UILayout) -> None:
     op.vTooltip = "Asset already acquired"
 
 
+def _mk_button(layout: bpy.types.UILayout,
+               op_id: str,
+               text: str,
+               icon: str,
+               tooltip: str,
+               **extras
+               ) -> bpy.types.OperatorProperties:
+    """Adds an operator button and sets its tooltip and further properties.
+
+    Properties get set in the order passed. Sizes need to be applied
+    afterwards via safe_size_apply(), as they depend on vType being set.
+    """
+    op = layout.operator(op_id, text=text, icon=icon)
+    op.vTooltip = tooltip
+    for name, value in extras.items():
+        setattr(op, name, value)
+    return op
+
+
 def draw_button_model_local(layout_row: bpy.types.UILayout,
                             asset_data: Dict,
                             error: DisplayError
@@ -1444,15 +1606,10 @@ def draw_button_model_local(layout_row: bpy.types.UILayout,
             label = f"Import {size}"
         icon = "TRACKING_REFINE_BACKWARDS"
 
-    op = layout_row.operator(
-        "poliigon.poliigon_model",
-        text=label,
-        icon=icon,
-    )
-    op.vAsset = asset_name
-    op.vTooltip = tip
-    op.vType = asset_type
-    op.vLod = lod if len(lod) > 0 else "NONE"
+    op = _mk_button(layout_row, "poliigon.poliigon_model", label, icon, tip,
+                    vAsset=asset_name,
+                    vType=asset_type,
+                    vLod=lod or "NONE")
     safe_size_apply(op, size, asset_name)  # has to be set after vType!
 
 
@@ -1461,14 +1618,13 @@ def draw_button_model_imported(layout_row: bpy.types.UILayout,
                                ) -> None:
     asset_name = asset_data["name"]
 
-    op = layout_row.operator(
-        "poliigon.poliigon_select",
-        text="Select",
-        icon="RESTRICT_SELECT_OFF",
-    )
-    op.vMode = "model"
-    op.vData = asset_name
-    op.vTooltip = f"{asset_name}\n(Select all instances)"
+    _mk_button(layout_row,
+               "poliigon.poliigon_select",
+               "Select",
+               "RESTRICT_SELECT_OFF",
+               f"{asset_name}\n(Select all instances)",
+               vMode="model",
+               vData=asset_name)
 
 
 def set_op_mat_disp_strength(ops, asset_name: str, mode_disp: str) -> None:
@@ -1495,7 +1651,7 @@ def draw_button_texture_local(layout_row: bpy.types.UILayout,
     label = "Import " + size_default
     icon = "TRACKING_REFINE_BACKWARDS"
     tooltip = f"{asset_name}\n(Import Material)"
-    if len(sizes_in_scene):
+    if sizes_in_scene:
         row_button.enabled = is_selection
         label = "Apply " + size_default
         icon = "TRACKING_REFINE_BACKWARDS"
@@ -1506,28 +1662,23 @@ def draw_button_texture_local(layout_row: bpy.types.UILayout,
         tooltip = f"{asset_name}\n(Import + Apply Material)"
 
     if error:
-        op = row_button.operator(
-            "poliigon.poliigon_material",
-            text=error.button_label,
-            icon="ERROR",
-        )
-        op.vTooltip = error.description
-    else:
-        op = row_button.operator(
-            "poliigon.poliigon_material",
-            text=label,
-            icon=icon,
-        )
-        op.vTooltip = tooltip
+        label = error.button_label
+        icon = "ERROR"
+        tooltip = error.description
 
-    op.vType = asset_type
-    op.vAsset = asset_name
+    op = _mk_button(row_button,
+                    "poliigon.poliigon_material",
+                    label,
+                    icon,
+                    tooltip,
+                    vType=asset_type,
+                    vAsset=asset_name,
+                    mapping="UV",
+                    scale=1.0,
+                    use_16bit=cTB.vSettings["use_16"],
+                    reuse_material=True,
+                    vData=asset_name + "@" + size_default)
     safe_size_apply(op, size_default, asset_name)
-    op.mapping = "UV"
-    op.scale = 1.0
-    op.use_16bit = cTB.vSettings["use_16"]
-    op.reuse_material = True
-    op.vData = asset_name + "@" + size_default
     set_op_mat_disp_strength(op, asset_name, op.mode_disp)
 
 
@@ -1537,15 +1688,14 @@ def draw_button_texture_imported(layout_row: bpy.types.UILayout,
     asset_name = asset_data["name"]
     asset_type = asset_data["type"]
 
-    op = layout_row.operator(
-        "poliigon.poliigon_apply",
-        text="Apply",
-        icon="TRACKING_REFINE_BACKWARDS",
-    )
-    op.vType = asset_type
-    op.vAsset = asset_name
-    op.vMat = cTB.imported_assets["Textures"][asset_name][0].name
-    op.vTooltip = f"{asset_name}\n(Apply to selected models)"
+    _mk_button(layout_row,
+               "poliigon.poliigon_apply",
+               "Apply",
+               "TRACKING_REFINE_BACKWARDS",
+               f"{asset_name}\n(Apply to selected models)",
+               vType=asset_type,
+               vAsset=asset_name,
+               vMat=cTB.imported_assets["Textures"][asset_name][0].name)
 
 
 def draw_button_hdri_local(layout_row: bpy.types.UILayout,
@@ -1556,20 +1706,16 @@ def draw_button_hdri_local(layout_row: bpy.types.UILayout,
     asset_name = asset_data["name"]
 
     if error:
-        op = layout_row.operator(
-            "poliigon.poliigon_hdri",
-            text=error.button_label,
-            icon="ERROR",
-        )
-        op.vTooltip = error.description
+        label = error.button_label
+        icon = "ERROR"
+        tooltip = error.description
     else:
-        op = layout_row.operator(
-            "poliigon.poliigon_hdri",
-            text=f"Import {size_default}",
-            icon="TRACKING_REFINE_BACKWARDS",
-        )
-        op.vTooltip = f"{asset_name}\n(Import HDRI)"
-    op.vAsset = asset_name
+        label = f"Import {size_default}"
+        icon = "TRACKING_REFINE_BACKWARDS"
+        tooltip = f"{asset_name}\n(Import HDRI)"
+
+    op = _mk_button(layout_row, "poliigon.poliigon_hdri", label, icon, tooltip,
+                    vAsset=asset_name)
     safe_size_apply(op, size_default, asset_name)
     if cTB.vSettings["hdri_use_jpg_bg"]:
         op.size_bg = f"{cTB.vSettings['hdrib']}_JPG"
@@ -1582,12 +1728,12 @@ def draw_button_hdri_imported(layout_row: bpy.types.UILayout,
                               ) -> None:
     asset_name = asset_data["name"]
 
-    op = layout_row.operator(
-        "poliigon.poliigon_hdri",
-        text="Apply",
-        icon="TRACKING_REFINE_BACKWARDS",
-    )
-    op.vAsset = asset_name
+    op = _mk_button(layout_row,
+                    "poliigon.poliigon_hdri",
+                    "Apply",
+                    "TRACKING_REFINE_BACKWARDS",
+                    f"{asset_name}\n(Apply to Scene)",
+                    vAsset=asset_name)
     # NOTE: Size values will not be used, due to do_apply being set.
     #       Nevertheless the values need to exist in the size enums.
     hdri_size = cTB.vSettings['hdri']
@@ -1597,7 +1743,6 @@ def draw_button_hdri_imported(layout_row: bpy.types.UILayout,
     except TypeError as e:
         print(f"Failed to assign bg {hdri_size} for asset {asset_name}: {e})")
     op.do_apply = True
-    op.vTooltip = f"{asset_name}\n(Apply to Scene)"
 
 
 def draw_button_brush_local(layout_row: bpy.types.UILayout,
@@ -1608,20 +1753,17 @@ def draw_button_brush_local(layout_row: bpy.types.UILayout,
     asset_name = asset_data["name"]
 
     if error:
-        op = layout_row.operator(
-            "poliigon.poliigon_brush",
-            text=error.button_label,
-            icon="ERROR",
-        )
-        op.vTooltip = error.description
+        label = error.button_label
+        icon = "ERROR"
+        tooltip = error.description
     else:
-        op = layout_row.operator(
-            "poliigon.poliigon_brush",
-            text=f"Import {size_default}",
-            icon="TRACKING_REFINE_BACKWARDS",
-        )
-        op.vTooltip = f"{asset_name}\n(Import Brush)"
-    op.vAsset = asset_name
+        label = f"Import {size_default}"
+        icon = "TRACKING_REFINE_BACKWARDS"
+        tooltip = f"{asset_name}\n(Import Brush)"
+
+    op = _mk_button(layout_row, "poliigon.poliigon_brush", label, icon,
+                    tooltip,
+                    vAsset=asset_name)
     safe_size_apply(op, size_default, asset_name)
 
 
@@ -1638,14 +1780,35 @@ def draw_button_brush_imported(layout_row: bpy.types.UILayout,
         label = "Activate"
         tooltip = f"{asset_name}\n(Set as Active Brush)"
 
-    op = layout_row.operator(
-        "poliigon.poliigon_brush",
-        text=label,
-        icon="BRUSH_DATA",
-    )
-    op.vAsset = asset_name
-    op.vSize = "apply"
-    op.vTooltip = tooltip
+    _mk_button(layout_row, "poliigon.poliigon_brush", label, "BRUSH_DATA",
+               tooltip,
+               vAsset=asset_name,
+               vSize="apply")
+
+
+# Buttons of local assets per asset type, all called with
+# (row, asset_data, error, sizes_in_scene, size_default, is_selection)
+_DRAW_BUTTON_LOCAL = {
+    "Models": lambda row, asset_data, error, _sizes, _size, _sel:
+        draw_button_model_local(row, asset_data, error),
+    "Textures": draw_button_texture_local,
+    "HDRIs": lambda row, asset_data, error, _sizes, size, _sel:
+        draw_button_hdri_local(row, asset_data, error, size),
+    "Brushes": lambda row, asset_data, error, _sizes, size, _sel:
+        draw_button_brush_local(row, asset_data, error, size),
+}
+
+# Buttons of imported assets per asset type, all called with
+# (row, asset_data, name_brush_active)
+_DRAW_BUTTON_IMPORTED = {
+    "Models": lambda row, asset_data, _brush:
+        draw_button_model_imported(row, asset_data),
+    "Textures": lambda row, asset_data, _brush:
+        draw_button_texture_imported(row, asset_data),
+    "HDRIs": lambda row, asset_data, _brush:
+        draw_button_hdri_imported(row, asset_data),
+    "Brushes": draw_button_brush_imported,
+}
 
 
 def draw_button_download(layout_row: bpy.types.UILayout,
@@ -1657,24 +1820,24 @@ def draw_button_download(layout_row: bpy.types.UILayout,
     asset_type = asset_data["type"]
 
     if error:
-        op = layout_row.operator(
-            "poliigon.poliigon_download",
-            text=error.button_label,
-            icon="ERROR",
-        )
-        op.vTooltip = error.description
+        label = error.button_label
+        icon = "ERROR"
+        tooltip = error.description
     else:
-        op = layout_row.operator(
-            "poliigon.poliigon_download",
-            text=f"Download {size_default}",
-        )
-        op.vTooltip = f"{asset_name}\nDownload Default"
+        label = f"Download {size_default}"
+        icon = "NONE"
+        tooltip = f"{asset_name}\nDownload Default"
         with cTB.lock_download:
             layout_row.enabled = asset_data["id"] not in cTB.vDownloadCancelled
 
-    op.vMode = "download"
-    op.vAsset = asset_name
-    op.vType = asset_type
+    op = _mk_button(layout_row,
+                    "poliigon.poliigon_download",
+                    label,
+                    icon,
+                    tooltip,
+                    vMode="download",
+                    vAsset=asset_name,
+                    vType=asset_type)
     safe_size_apply(op, size_default, asset_name)
 
 
@@ -1702,26 +1865,23 @@ def draw_button_purchase(layout_row: bpy.types.UILayout,
     icon = 'ERROR' if error else 'NONE'
 
     if error and error.goto_account is True:
-        op = layout_row.operator(
-            "poliigon.poliigon_setting",
-            text=label,
-            icon=icon
-        )
-        op.vMode = "my_account"
-        op.vTooltip = error.description
+        _mk_button(layout_row, "poliigon.poliigon_setting", label, icon,
+                   error.description,
+                   vMode="my_account")
     else:
-        op = layout_row.operator(
-            "poliigon.poliigon_download", text=label,
-            icon=icon
-        )
-        op.vAsset = f"{asset_name}@{asset_id}"
-        op.vType = asset_type
-        safe_size_apply(op, size_default, asset_name)
-        op.vMode = "purchase"
         if error:
-            op.vTooltip = error.description
+            tooltip = error.description
         else:
-            op.vTooltip = f"Purchase {asset_name}"
+            tooltip = f"Purchase {asset_name}"
+        op = _mk_button(layout_row,
+                        "poliigon.poliigon_download",
+                        label,
+                        icon,
+                        tooltip,
+                        vAsset=f"{asset_name}@{asset_id}",
+                        vType=asset_type,
+                        vMode="purchase")
+        safe_size_apply(op, size_default, asset_name)
 
 
 def draw_button_quick_menu(layout_row: bpy.types.UILayout,
@@ -1729,7 +1889,6 @@ def draw_button_quick_menu(layout_row: bpy.types.UILayout,
                            is_downloaded: bool
                            ) -> None:
     asset_name = asset_data["name"]
-    asset_sizes = asset_data["sizes"]
 
     quick_subtitle = "\n(options)" if is_downloaded else "\nSee More"
 
@@ -1738,9 +1897,25 @@ def draw_button_quick_menu(layout_row: bpy.types.UILayout,
         text="",
         icon="TRIA_DOWN",
     )
-    op.asset_data_s = json.dumps(asset_data)
+    # Serializing the entire asset dict per tile and redraw is costly,
+    # thus cached on the dict. Derived data ("exts" and "_" prefixed caches)
+    # is not part of the payload.
+    asset_data_s = asset_data.get("_json_cache")
+    if asset_data_s is None:
+        asset_data_payload = {
+            key: value
+            for key, value in asset_data.items()
+            if key != "exts" and not key.startswith("_")
+        }
+        asset_data_s = json.dumps(asset_data_payload)
+        asset_data["_json_cache"] = asset_data_s
+    op.asset_data_s = asset_data_s
     op.vTooltip = f"{asset_name}{quick_subtitle}"
-    op.vSizes = ";".join(asset_sizes)
+    sizes_joined = asset_data.get("_sizes_joined")
+    if sizes_joined is None:
+        sizes_joined = ";".join(asset_data["sizes"])
+        asset_data["_sizes_joined"] = sizes_joined
+    op.vSizes = sizes_joined
 
 
 def draw_missing_grid_dummies(layout_grid: bpy.types.UILayout,
@@ -1808,7 +1983,7 @@ def draw_page_buttons(area: str, idx_page_current: int, at_top: bool = False
     if idx_page_start > 1:
         row_middle.label(
             text="",
-            icon_value=cTB.vIcons["ICON_dots"].icon_id,
+            icon_value=_IconIds.ICON_dots,
         )
 
     for idx_page in range(idx_page_start, idx_page_end):
@@ -1828,7 +2003,7 @@ def draw_page_buttons(area: str, idx_page_current: int, at_top: bool = False
         op.vTooltip = "Go to Page " + str(idx_page + 1)
 
     if idx_page_end < num_pages - 1:
-        row_middle.label(text="", icon_value=cTB.vIcons["ICON_dots"].icon_id)
+        row_middle.label(text="", icon_value=_IconIds.ICON_dots)
 
     op = row_middle.operator(
         "poliigon.poliigon_setting",
@@ -1870,7 +2045,7 @@ def draw_view_more_my_assets(layout_box_not_found: bpy.types.UILayout) -> None:
     op = row.operator(
         "poliigon.poliigon_setting",
         text=label,
-        icon_value=cTB.vIcons["ICON_poliigon"].icon_id
+        icon_value=_IconIds.ICON_poliigon
     )
     op.vMode = "view_more"
 
@@ -1890,7 +2065,7 @@ def draw_view_more_imported(sorted_assets: List[Dict]) -> None:
         op = row.operator(
             "poliigon.poliigon_setting",
             text="Explore Your Assets",
-            icon_value=cTB.vIcons["ICON_myassets"].icon_id,
+            icon_value=_IconIds.ICON_myassets,
         )
         op.vMode = "area_my_assets"
         op.vTooltip = "Show My Assets"
@@ -1899,7 +2074,7 @@ def draw_view_more_imported(sorted_assets: List[Dict]) -> None:
         op = row.operator(
             "poliigon.poliigon_setting",
             text="Explore Poliigon Assets",
-            icon_value=cTB.vIcons["ICON_poliigon"].icon_id,
+            icon_value=_IconIds.ICON_poliigon,
         )
         op.vMode = "area_poliigon"
         op.vTooltip = "Show Poliigon Assets"
@@ -1923,7 +2098,9 @@ def f_BuildAssets(cTB):
 
         cTB.vCheckScale = 1
 
-    area = cTB.vSettings["area"]
+    settings = cTB.vSettings
+    area = settings["area"]
+    page_size = settings["page"]
     idx_page_current = cTB.vPage[area]
 
     draw_page_buttons(area, idx_page_current, at_top=True)
@@ -1932,14 +2109,15 @@ def f_BuildAssets(cTB):
 
     cTB.print_debug(dbg, "sorted_assets", len(sorted_assets))
 
-    thumb_size_factor = THUMB_SIZE_FACTOR[cTB.vSettings["thumbsize"]]
-
-    category = cTB.vActiveCat[0].replace("All ", "")
-    if len(cTB.vActiveCat) > 1:
-        category = f"{cTB.vActiveCat[-1]} {category}"
+    thumb_size_factor = THUMB_SIZE_FACTOR[settings["thumbsize"]]
 
     box_not_found = None
-    if not len(sorted_assets):
+    if not sorted_assets:
+        # Category label only needed for the "no assets" message
+        active_cat = cTB.vActiveCat
+        category = active_cat[0].replace("All ", "")
+        if len(active_cat) > 1:
+            category = f"{active_cat[-1]} {category}"
         box_not_found = build_assets_no_assets(area, category)
     else:
         grid, thumb_width, num_columns = build_assets_prepare_grid(
@@ -1947,53 +2125,59 @@ def f_BuildAssets(cTB):
 
         is_selection = len(bpy.context.selected_objects) > 0
 
-        idx_asset_start = idx_page_current * cTB.vSettings["page"]
-        idx_asset_end = min(idx_asset_start + cTB.vSettings["page"],
-                            len(sorted_assets))
-
+        # Slice to the visible assets once
         if area == "imported":
+            idx_asset_start = idx_page_current * page_size
+            idx_asset_end = min(idx_asset_start + page_size,
+                                len(sorted_assets))
             sorted_assets = sorted_assets[idx_asset_start:idx_asset_end]
+        else:
+            # Already the current page's assets, see f_GetAssetsSorted()
+            sorted_assets = sorted_assets[:page_size]
 
-        name_brush_active = get_active_brush()
+        # Invariant for the entire grid and only needed for imported brushes
+        name_brush_active = None
+        if area == "imported":
+            name_brush_active = get_active_brush()
 
-        # Build Asset Grid ...
-        for idx_asset in range(len(sorted_assets)):
-            if idx_asset >= cTB.vSettings["page"]:
-                break
+        key_settings = get_draw_state_settings()
+
+        # Errors associated with assets, such as after or during download
+        # failure. First error per asset wins.
+        errors_by_id = {}
+        for err in cTB.ui_errors:
+            errors_by_id.setdefault(err.asset_id, err)
+
+        purchased = cTB.vPurchasedSet
 
-            # vAData deliberately not changed to coding style
-            # as it is used this way throughout the code base
-            vAData = sorted_assets[idx_asset]
+        # Submit all of the page's previews up front, so missing thumbnails
+        # are already downloading while the grid's layout gets built
+        for vAData in sorted_assets:
+            if vAData["name"] != "dummy":
+                cTB.f_GetPreview(vAData["name"])
+
+        # Build Asset Grid ...
+        # vAData deliberately not changed to coding style
+        # as it is used this way throughout the code base
+        for vAData in sorted_assets:
             asset_name = vAData["name"]
+            if asset_name == "dummy":
+                draw_cell_dummy(grid, thumb_size_factor)
+                continue
+
             asset_name_display = vAData.get("name_beauty", None)
             if asset_name_display is None:
                 asset_name_display = asset_name
             asset_type = vAData["type"]
+            asset_id = vAData.get("id")
 
-            # See if there's any errors associated with this asset,
-            # such as after or during download failure.
-            errs = [
-                err
-                for err in cTB.ui_errors
-                if vAData.get("id") and err.asset_id == vAData["id"]
-            ]
-            error = errs[0] if errs else None
-            del errs
-
-            asset_sizes_local = get_local_sizes(vAData)
+            error = errors_by_id.get(asset_id) if asset_id else None
 
-            is_backplate = cTB.check_backplate(asset_name)
-
-            cTB.f_GetPreview(asset_name)
-
-            is_downloaded = determine_downloaded(vAData)
-
-            size_default = determine_default_size(
-                vAData, asset_sizes_local, is_downloaded)
-            sizes_in_scene, size_default = determine_in_scene_sizes(
-                vAData, size_default)
-            size_default = cTB.get_last_downloaded_size(
-                asset_name, size_default)
+            (is_backplate,
+             is_downloaded,
+             sizes_in_scene,
+             size_default,
+             is_supported) = get_asset_draw_state(vAData, area, key_settings)
 
             num_credits = vAData["credits"]
 
@@ -2011,65 +2195,52 @@ def f_BuildAssets(cTB):
 
             row = cell.row(align=True)
 
-            if asset_name == "dummy":
-                draw_thumb_state_asset_dummy(row)
-            elif cTB.check_if_purchase_queued(vAData.get("id")):
+            if cTB.check_if_purchase_queued(asset_id):
                 draw_thumb_state_asset_purchasing(row)
-            elif cTB.check_if_download_queued(vAData.get("id")):
+            elif cTB.check_if_download_queued(asset_id):
                 draw_thumb_state_asset_downloading(row, vAData, thumb_width)
-            elif asset_name in cTB.vQuickPreviewQueue.keys():
+            elif asset_name in cTB.vQuickPreviewQueue:
                 # TODO(Andreas): When is this branch used???
                 #                Looks as if vQuickPreviewQueue is not written to
                 draw_thumb_state_asset_downloading_quick_preview(row, vAData)
             elif area in ["poliigon", "my_assets"]:
-                if asset_type == "Textures" and asset_name not in cTB.vPurchased:
+                is_purchased = asset_name in purchased
+                if asset_type == "Textures" and not is_purchased:
                     draw_button_quick_preview(
                         row, vAData, is_backplate, is_selection)
-                elif asset_name in cTB.vPurchased and area == "poliigon":
+                elif is_purchased and area == "poliigon":
                     draw_checkmark_imported(row)
 
-                if asset_name in cTB.vPurchased:
+                if is_purchased:
                     if is_downloaded:
-                        if asset_type == "Models":
-                            draw_button_model_local(row, vAData, error)
-                        elif asset_type == "Textures":
-                            draw_button_texture_local(row,
-                                                      vAData,
-                                                      error,
-                                                      sizes_in_scene,
-                                                      size_default,
-                                                      is_selection)
-                        elif asset_type == "HDRIs":
-                            draw_button_hdri_local(
-                                row, vAData, error, size_default)
-                        elif asset_type == "Brushes":
-                            draw_button_brush_local(
-                                row, vAData, error, size_default)
+                        draw_button_local = _DRAW_BUTTON_LOCAL.get(asset_type)
+                        if draw_button_local is not None:
+                            draw_button_local(row,
+                                              vAData,
+                                              error,
+                                              sizes_in_scene,
+                                              size_default,
+                                              is_selection)
                     else:
-                        if not check_convention(vAData):
+                        if not is_supported:
                             draw_button_unsupported_convention(row)
                         else:
                             draw_button_download(
                                 row, vAData, error, size_default)
                 else:
-                    if not check_convention(vAData):
+                    if not is_supported:
                         draw_button_unsupported_convention(row)
                     else:
                         draw_button_purchase(
                             row, vAData, error, size_default, num_credits)
 
-                if is_downloaded or check_convention(vAData):
+                if is_downloaded or is_supported:
                     draw_button_quick_menu(row, vAData, is_downloaded)
 
             elif area == "imported":
-                if asset_type == "Models":
-                    draw_button_model_imported(row, vAData)
-                elif asset_type == "Textures":
-                    draw_button_texture_imported(row, vAData)
-                elif asset_type == "HDRIs":
-                    draw_button_hdri_imported(row, vAData)
-                elif asset_type == "Brushes":
-                    draw_button_brush_imported(row, vAData, name_brush_active)
+                draw_button_imported = _DRAW_BUTTON_IMPORTED.get(asset_type)
+                if draw_button_imported is not None:
+                    draw_button_imported(row, vAData, name_brush_active)
 
             cell.separator()
 
@@ -2088,29 +2259,78 @@ def f_BuildAssets(cTB):
 # Draw popups
 # .............................................................................
 
-def _asset_has_local_blend_file(asset_data: Dict) -> bool:
-    if asset_data is None:
-        return False
-    for path in asset_data["files"]:
-        if utils.f_FExt(path) == ".blend":
-            return True
-    return False
-
+def _asset_local_model_flags(asset_data: Dict) -> Tuple[bool, bool]:
+    """Returns tuple (has_blend, has_fbx) for the local files of an asset.
 
-def _asset_has_local_fbx_file(asset_data: Dict) -> bool:
+    Result gets cached on the asset data.
+    """
     if asset_data is None:
-        return False
+        return False, False
+    flags = asset_data.get("_model_flags")
+    if flags is not None:
+        return flags
+
+    has_blend = False
+    has_fbx = False
     for path in asset_data["files"]:
-        is_fbx = utils.f_FExt(path) == ".fbx"
-        if is_fbx and "_SOURCE" not in os.path.basename(path):
-            return True
-    return False
+        # Same as comparing utils.f_FExt(), without splitting the path
+        path_lower = path.lower()
+        if path_lower.endswith(".blend"):
+            has_blend = True
+        elif (path_lower.endswith(".fbx")
+              and "_SOURCE" not in os.path.basename(path)):
+            has_fbx = True
+        if has_blend and has_fbx:
+            break
+    flags = (has_blend, has_fbx)
+    asset_data["_model_flags"] = flags
+    return flags
+
+
+@dataclass
+class QuickMenuState:
+    """Asset state the quick menu gets drawn with, gathered once per popup."""
+
+    downloaded: List[str]  # Sizes already downloaded
+    in_scene: bool
+    any_model: bool  # Local .blend or .fbx available
+    is_linked_blend_import: bool
+    is_supported: bool  # Convention of the asset supported by addon
+
+    @classmethod
+    def from_asset(cls,
+                   asset_data_tab: Dict,
+                   asset_data_local: Optional[Dict]
+                   ) -> "QuickMenuState":
+        """Builds the state, caller is expected to hold cTB.lock_assets."""
+
+        asset_name = asset_data_tab["name"]
+        asset_type = asset_data_tab["type"]
+
+        downloaded = []
+        if asset_data_local is not None:
+            downloaded = asset_data_local["sizes"]
+
+        in_scene = asset_name in cTB.imported_assets.get(asset_type, {})
+
+        blend_exists, fbx_exists = _asset_local_model_flags(asset_data_local)
+        is_linked_blend_import = (cTB.vSettings["download_prefer_blend"]
+                                  and cTB.link_blend_session
+                                  and blend_exists)
+
+        return cls(downloaded=downloaded,
+                   in_scene=in_scene,
+                   any_model=blend_exists or fbx_exists,
+                   is_linked_blend_import=is_linked_blend_import,
+                   is_supported=check_convention(asset_data_tab))
 
 
 def show_quick_menu(
         cTB, asset_data_tab, sizes=[]):
     """Generates the quick options menu next to an asset in the UI grid."""
 
+    _IconIds.ensure_loaded()
+
     asset_name = asset_data_tab["name"]
     asset_id = asset_data_tab["id"]
     asset_type = asset_data_tab["type"]
@@ -2119,47 +2339,49 @@ def show_quick_menu(
     # asset_convention_local = asset_data["local_convention"]
 
     # Configuration
-    if asset_name in cTB.vPurchased:
+    is_purchased = asset_name in cTB.vPurchasedSet
+    if is_purchased:
         title = "Choose Texture Size"  # If downloading and already purchased.
     else:
         title = asset_name
 
-    downloaded = []  # Sizes already downloaded.
-    in_scene = False
-
     asset_data = None
     with cTB.lock_assets:
-        if asset_type in cTB.vAssets["local"].keys():
-            if asset_name in cTB.vAssets["local"][asset_type].keys():
-                asset_data = cTB.vAssets["local"][asset_type][asset_name]
-                downloaded = asset_data["sizes"]
-
-    if asset_type in cTB.imported_assets.keys():
-        if asset_name in cTB.imported_assets[asset_type].keys():
-            in_scene = True
-
-    prefer_blend = cTB.vSettings["download_prefer_blend"]
-    link_blend = cTB.link_blend_session
-    blend_exists = _asset_has_local_blend_file(asset_data)
-    fbx_exists = _asset_has_local_fbx_file(asset_data)
-    any_model = blend_exists or fbx_exists
-    is_linked_blend_import = prefer_blend and link_blend and blend_exists
+        assets_local = cTB.vAssets["local"]
+        if asset_type in assets_local:
+            asset_data = assets_local[asset_type].get(asset_name)
+        state = QuickMenuState.from_asset(asset_data_tab, asset_data)
+    downloaded = state.downloaded
+    in_scene = state.in_scene
+
+    # Snapshot of material names, instead of a lookup per size row
+    names_material = frozenset()
+    if asset_type == "Textures":
+        names_material = frozenset(bpy.data.materials.keys())
+
+    # Size of an imported HDRI, same for all size rows
+    size_light = ""
+    if in_scene and asset_type == "HDRIs":
+        image_name_light = asset_name + "_Light"
+        if image_name_light in bpy.data.images:
+            path_light = bpy.data.images[image_name_light].filepath
+            filename = os.path.basename(path_light)
+            match_object = _HDRI_SIZE_RE.search(filename)
+            size_light = match_object.group(1) if match_object else cTB.vSettings["hdri"]
 
     @reporting.handle_draw()
     def draw(self, context):
         layout = self.layout
 
         # List the different resolution sizes to provide.
-        if asset_name in cTB.vPurchased:
+        if is_purchased:
+            draw_sizes = draw_sizes_by_type.get(asset_type)
+            if asset_type == "Textures":
+                is_selection = len(context.selected_objects) > 0
+                draw_sizes = partial(draw_sizes, is_selection=is_selection)
             for size in sizes:
-                if asset_type == "Textures":
-                    draw_material_sizes(context, size, layout)
-                elif asset_type == "Models":
-                    draw_model_sizes(context, size, layout)
-                elif asset_type == "Brushes":
-                    draw_brush_sizes(context, size, layout)
-                elif asset_type == "HDRIs":
-                    draw_hdri_sizes(context, size, layout)
+                if draw_sizes is not None:
+                    draw_sizes(context, size, layout)
                 else:
                     layout.label(text=f"{asset_type} not implemented yet")
 
@@ -2185,7 +2407,7 @@ def show_quick_menu(
         ops = layout.operator(
             "poliigon.poliigon_link",
             text="View online",
-            icon_value=cTB.vIcons["ICON_poliigon"].icon_id,
+            icon_value=_IconIds.ICON_poliigon,
         )
         ops.vMode = str(asset_id)
         ops.vTooltip = "View on Poliigon.com"
@@ -2202,7 +2424,7 @@ def show_quick_menu(
             in_asset_browser = asset_data.get("in_asset_browser", False)
             is_brush = asset_type == "Brushes"
             is_feature_avail = bpy.app.version >= (3, 0)
-            missing_local_model = asset_type == "Models" and not any_model
+            missing_local_model = asset_type == "Models" and not state.any_model
             if not is_brush and is_feature_avail and not missing_local_model:
                 layout.separator()
                 row = layout.row()
@@ -2213,26 +2435,26 @@ def show_quick_menu(
                 ops.asset_name = asset_name
                 row.enabled = not in_asset_browser and not cTB.lock_client_start.locked()
 
-    def draw_material_sizes(context, size, element):
+    def draw_material_sizes(context, size, element, is_selection):
         """Draw the menu row for a materials' single resolution size."""
         row = element.row()
-        imported = f"{asset_name}_{size}" in bpy.data.materials
+        imported = f"{asset_name}_{size}" in names_material
 
         if imported or size in downloaded:
             # Action: Load and apply it
             if imported:
-                label = f"{size} (apply material)"
+                label = _size_label(size, "apply material")
                 tip = f"Apply {size} Material\n{asset_name}"
-            elif context.selected_objects:
-                label = f"{size} (import + apply)"
+            elif is_selection:
+                label = _size_label(size, "import + apply")
                 tip = f"Apply {size} Material\n{asset_name}"
             else:
-                label = f"{size} (import)"
+                label = _size_label(size, "import")
                 tip = f"Import {size} Material\n{asset_name}"
 
             # If nothing is selected and this size is already importing,
             # then there's nothing to do.
-            if imported and not context.selected_objects:
+            if imported and not is_selection:
                 row.enabled = False
 
             ops = row.operator(
@@ -2251,10 +2473,10 @@ def show_quick_menu(
             set_op_mat_disp_strength(ops, asset_name, ops.mode_disp)
         else:
             # Action: Download
-            if check_convention(asset_data_tab):
-                label = f"{size} (download)"
+            if state.is_supported:
+                label = _size_label(size, "download")
             else:
-                label = f"{size} (Update needed)"
+                label = _size_label(size, "Update needed")
                 row.enabled = False
             ops = row.operator(
                 "poliigon.poliigon_download",
@@ -2270,12 +2492,12 @@ def show_quick_menu(
         """Draw the menu row for a model's single resolution size."""
         row = element.row()
 
-        if size in downloaded and any_model:
+        if size in downloaded and state.any_model:
             # Action: Load and apply it
             lod, label, tip = get_model_op_details(asset_name,
                                                    asset_type,
                                                    size)
-            if is_linked_blend_import:
+            if state.is_linked_blend_import:
                 label += " (disable link .blend to import size)"
 
             ops = row.operator(
@@ -2286,14 +2508,14 @@ def show_quick_menu(
             ops.vType = asset_type
             safe_size_apply(ops, size, asset_name)
             ops.vTooltip = tip
-            ops.vLod = lod if len(lod) > 0 else "NONE"
-            row.enabled = not is_linked_blend_import
+            ops.vLod = lod or "NONE"
+            row.enabled = not state.is_linked_blend_import
         else:
             # Action: Download
-            if check_convention(asset_data_tab):
-                label = f"{size} (download)"
+            if state.is_supported:
+                label = _size_label(size, "download")
             else:
-                label = f"{size} (Update needed)"
+                label = _size_label(size, "Update needed")
                 row.enabled = False
             ops = row.operator(
                 "poliigon.poliigon_download",
@@ -2309,22 +2531,13 @@ def show_quick_menu(
         """Draw the menu row for an HDRI's single resolution size."""
         row = element.row()
 
-        size_light = ""
-        if in_scene:
-            image_name_light = asset_name + "_Light"
-            if image_name_light in bpy.data.images.keys():
-                path_light = bpy.data.images[image_name_light].filepath
-                filename = os.path.basename(path_light)
-                match_object = re.search(r"_(\d+K)[_\.]", filename)
-                size_light = match_object.group(1) if match_object else cTB.vSettings["hdri"]
-
         if size in downloaded:
             # Action: Load and apply it
             if size == size_light:
-                label = f"{size} (apply HDRI)"
+                label = _size_label(size, "apply HDRI")
                 tip = f"Apply {size} HDRI\n{asset_name}"
             else:
-                label = f"{size} (import HDRI)"
+                label = _size_label(size, "import HDRI")
                 tip = f"Import {size} HDRI\n{asset_name}"
 
             ops = row.operator(
@@ -2344,10 +2557,10 @@ def show_quick_menu(
 
         else:
             # Action: Download
-            if check_convention(asset_data_tab):
-                label = f"{size} (download)"
+            if state.is_supported:
+                label = _size_label(size, "download")
             else:
-                label = f"{size} (Update needed)"
+                label = _size_label(size, "Update needed")
                 row.enabled = False
             ops = row.operator(
                 "poliigon.poliigon_download",
@@ -2365,10 +2578,10 @@ def show_quick_menu(
         if in_scene or size in downloaded:
             # Action: Load and apply it
             if in_scene:
-                label = f"{size} (equip brush)"
+                label = _size_label(size, "equip brush")
                 tip = f"Equip {size} brush\n{asset_name}"
             else:
-                label = f"{size} (import brush)"
+                label = _size_label(size, "import brush")
                 tip = f"Equip {size} brush\n{asset_name}"
 
             ops = row.operator(
@@ -2381,10 +2594,10 @@ def show_quick_menu(
 
         else:
             # Action: Download
-            if check_convention(asset_data_tab):
-                label = f"{size} (download)"
+            if state.is_supported:
+                label = _size_label(size, "download")
             else:
-                label = f"{size} (Update needed)"
+                label = _size_label(size, "Update needed")
                 row.enabled = False
             ops = row.operator(
                 "poliigon.poliigon_download",
@@ -2396,6 +2609,14 @@ def show_quick_menu(
             ops.vMode = "download"
             ops.vTooltip = f"Download {size}\n{asset_name}"
 
+    # Size rows per asset type, textures additionally need is_selection
+    draw_sizes_by_type = {
+        "Textures": draw_material_sizes,
+        "Models": draw_model_sizes,
+        "Brushes": draw_brush_sizes,
+        "HDRIs": draw_hdri_sizes,
+    }
+
     # Generate the popup menu.
     bpy.context.window_manager.popup_menu(draw, title=title, icon="QUESTION")
 
@@ -2559,13 +2780,194 @@ def f_AssetInfo(cTB, vAsset):
     bpy.context.window_manager.popover(asset_info_draw, ui_units_x=15)
 
 
+@dataclass
+class _BannerLayout:
+    """Layout decisions of a notification banner, same for all its notices."""
+
+    is_single_row_url: bool
+    is_single_row_update: bool
+    is_single_row_popup: bool
+    width_label_dismiss: float
+    width_label_no_dismiss: float
+
+
+def _build_notice_mode(notice: Notification, url: str, action: str) -> str:
+    key = (url, action)
+    mode = notice.mode_cache.get(key)
+    if mode is None:
+        mode = "notify@{}@{}@{}".format(
+            url, action, notice.notification_id)
+        notice.mode_cache[key] = mode
+    return mode
+
+
+def _draw_notice_title_wrapped(notice: Notification,
+                               first_row: bpy.types.UILayout,
+                               banner: _BannerLayout,
+                               alert: bool
+                               ) -> None:
+    """Draws the title of a two row notice, wrapped if needed."""
+    col = first_row.column(align=True)
+    col.alert = alert
+    if notice.allow_dismiss:
+        width_label = banner.width_label_dismiss
+    else:
+        width_label = banner.width_label_no_dismiss
+    cTB.f_Label(width_label, notice.title, col)
+    col.alert = False
+
+
+def _draw_notice_open_url(notice: Notification,
+                          first_row: bpy.types.UILayout,
+                          main_col: bpy.types.UILayout,
+                          banner: _BannerLayout
+                          ) -> None:
+    if banner.is_single_row_url:
+        # Single row with text + button.
+        # TODO: generalize this for notification message and length,
+        # and if dismiss is included.
+        # During SOFT-780 this has been changed for POPUP_MESSAGE in a
+        # very simplistic way
+        # (commit: https://github.com/poliigon/poliigon-addon-blender/pull/278/commits/00296ab70288893a023a6705d52eb4505ce36897).
+        # When addressing this properly,
+        # make sure to address it for all notification types.
+        first_row.alert = True
+        first_row.label(text=notice.title)
+        first_row.alert = False
+        row_button = first_row
+    else:
+        # Two rows (or more, if text wrapping).
+        _draw_notice_title_wrapped(notice, first_row, banner, alert=True)
+        row_button = main_col.row(align=True)
+        row_button.scale_y = 1.0
+
+    ops = row_button.operator(
+        "poliigon.poliigon_link",
+        icon=notice.icon or "NONE",
+        text=notice.ac_open_url_label,
+    )
+    if notice.tooltip:
+        ops.vTooltip = notice.tooltip
+    ops.vMode = _build_notice_mode(
+        notice,
+        notice.ac_open_url_address,
+        notice.ac_open_url_label)
+
+
+def _draw_notice_update_ready(notice: Notification,
+                              first_row: bpy.types.UILayout,
+                              main_col: bpy.types.UILayout,
+                              banner: _BannerLayout
+                              ) -> None:
+    if banner.is_single_row_update:
+        # Single row with text + button.
+        first_row.alert = True
+        first_row.label(text=notice.title)
+        first_row.alert = False
+        splitrow = first_row.split(factor=0.7, align=True)
+        tooltip_logs = "See changes in this version"
+    else:
+        # Two rows (or more, if text wrapping).
+        _draw_notice_title_wrapped(notice, first_row, banner, alert=True)
+        second_row = main_col.row(align=True)
+        splitrow = second_row.split(factor=0.7, align=True)
+        tooltip_logs = notice.tooltip
+
+    splitcol = splitrow.split(align=True)
+    ops = splitcol.operator(
+        "poliigon.poliigon_link",
+        icon=notice.icon or "NONE",
+        text=str(notice.ac_update_ready_download_label),
+    )
+    if notice.tooltip:
+        ops.vTooltip = notice.tooltip
+    ops.vMode = _build_notice_mode(
+        notice,
+        notice.ac_update_ready_download_url,
+        notice.ac_update_ready_download_label)
+
+    splitcol = splitrow.split(align=True)
+    ops = splitcol.operator(
+        "poliigon.poliigon_link",
+        text=str(notice.ac_update_ready_logs_label),
+    )
+    if notice.tooltip:
+        ops.vTooltip = tooltip_logs
+    ops.vMode = _build_notice_mode(
+        notice,
+        notice.ac_update_ready_logs_url,
+        notice.ac_update_ready_logs_label)
+
+
+def _draw_notice_popup_message(notice: Notification,
+                               first_row: bpy.types.UILayout,
+                               main_col: bpy.types.UILayout,
+                               banner: _BannerLayout
+                               ) -> None:
+    if banner.is_single_row_popup and len(notice.title) <= 80:
+        # Single row with text + button.
+        first_row.alert = notice.ac_popup_message_alert
+        first_row.label(text=notice.title)
+        first_row.alert = False
+        row_button = first_row
+    else:
+        # Two rows (or more, if text wrapping).
+        _draw_notice_title_wrapped(
+            notice, first_row, banner, alert=notice.ac_popup_message_alert)
+        row_button = main_col.row(align=True)
+        row_button.scale_y = 1.0
+
+    ops = row_button.operator(
+        "poliigon.popup_message",
+        icon=notice.icon or "NONE",
+        text="View",
+    )
+    for name_prop, value in notice.get_op_payload():
+        setattr(ops, name_prop, value)
+
+
+def _draw_notice_run_operator(notice: Notification,
+                              first_row: bpy.types.UILayout,
+                              main_col: bpy.types.UILayout,
+                              banner: _BannerLayout
+                              ) -> None:
+    # Single row with only a button.
+    ops = first_row.operator(
+        "poliigon.notice_operator",
+        text=notice.title,
+        icon=notice.icon or "NONE",
+    )
+    for name_prop, value in notice.get_op_payload():
+        setattr(ops, name_prop, value)
+
+
+def _draw_notice_invalid(notice: Notification,
+                         first_row: bpy.types.UILayout,
+                         main_col: bpy.types.UILayout,
+                         banner: _BannerLayout
+                         ) -> None:
+    main_col.label(text=notice.title)
+    notice_id = notice.notification_id
+    if notice_id not in _notice_ids_invalid_reported:
+        # Report only once, instead of on every redraw
+        _notice_ids_invalid_reported.add(notice_id)
+        reporting.capture_message(
+            "invalid_notification_type", notice_id, "error")
+
+
+# Draw function per notification action type, see f_NotificationBanner()
+_NOTICE_HANDLERS = {
+    _ACTION_OPEN_URL: _draw_notice_open_url,
+    _ACTION_UPDATE_READY: _draw_notice_update_ready,
+    _ACTION_POPUP: _draw_notice_popup_message,
+    _ACTION_RUN_OP: _draw_notice_run_operator,
+}
+
+
 @reporting.handle_draw()
 def f_NotificationBanner(notifications, layout):
     """General purpose notification banner UI draw element."""
 
-    def build_mode(url, action, notification_id):
-        return "notify@{}@{}@{}".format(url, action, notification_id)
-
     if not notifications:
         return
 
@@ -2573,7 +2975,17 @@ def f_NotificationBanner(notifications, layout):
     row = box.row(align=True)
     main_col = row.column(align=True)
 
-    panel_width = cTB.vWidth / (cTB.get_ui_scale() or 1)
+    ui_scale = cTB.get_ui_scale()  # also refreshes notice paddings
+    width = cTB.vWidth
+    panel_width = width / (ui_scale or 1)
+    banner = _BannerLayout(
+        # Empirical for width for "Beta addon: [Take survey]" specifically.
+        is_single_row_url=panel_width > 250,
+        # Empirical for width for "Update ready: Download | logs".
+        is_single_row_update=panel_width > 300,
+        is_single_row_popup=panel_width > 250,
+        width_label_dismiss=width - cTB.notice_padding_dismiss,
+        width_label_no_dismiss=width - cTB.notice_padding_no_dismiss)
 
     for i, notice in enumerate(notifications):
         first_row = main_col.row(align=False)
@@ -2581,186 +2993,8 @@ def f_NotificationBanner(notifications, layout):
 
         cTB.notification_signal_view(notice)
 
-        if notice.action == Notification.ActionType.OPEN_URL:
-            # Empirical for width for "Beta addon: [Take survey]" specifically.
-            single_row_width = 250
-            if panel_width > single_row_width:
-                # Single row with text + button.
-                # TODO: generalize this for notification message and length,
-                # and if dismiss is included.
-                # During SOFT-780 this has been changed for POPUP_MESSAGE in a
-                # very simplistic way
-                # (commit: https://github.com/poliigon/poliigon-addon-blender/pull/278/commits/00296ab70288893a023a6705d52eb4505ce36897).
-                # When addressing this properly,
-                # make sure to address it for all notification types.
-                first_row.alert = True
-                first_row.label(text=notice.title)
-                first_row.alert = False
-                ops = first_row.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=notice.ac_open_url_label,
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_open_url_address,
-                    notice.ac_open_url_label,
-                    notice.notification_id)
-
-            else:
-                # Two rows (or more, if text wrapping).
-                col = first_row.column(align=True)
-                col.alert = True
-                # Empirically found squaring worked best for 1 & 2x displays,
-                # which accounts for the box+panel padding and the 'x' button.
-                if notice.allow_dismiss:
-                    padding_width = 32 * cTB.get_ui_scale()
-                else:
-                    padding_width = 17 * cTB.get_ui_scale()
-                cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
-                col.alert = False
-
-                second_row = main_col.row(align=True)
-                second_row.scale_y = 1.0
-                ops = second_row.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=notice.ac_open_url_label,
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_open_url_address,
-                    notice.ac_open_url_label,
-                    notice.notification_id)
-
-        elif notice.action == Notification.ActionType.UPDATE_READY:
-            # Empirical for width for "Update ready: Download | logs".
-            single_row_width = 300
-            if panel_width > single_row_width:
-                # Single row with text + button.
-                first_row.alert = True
-                first_row.label(text=notice.title)
-                first_row.alert = False
-                splitrow = first_row.split(factor=0.7, align=True)
-                splitcol = splitrow.split(align=True)
-
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=str(notice.ac_update_ready_download_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_download_url,
-                    notice.ac_update_ready_download_label,
-                    notice.notification_id)
-
-                splitcol = splitrow.split(align=True)
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    text=str(notice.ac_update_ready_logs_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = "See changes in this version"
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_logs_url,
-                    notice.ac_update_ready_logs_label,
-                    notice.notification_id)
-            else:
-                # Two rows (or more, if text wrapping).
-                col = first_row.column(align=True)
-                col.alert = True
-                if notice.allow_dismiss:
-                    padding_width = 32 * cTB.get_ui_scale()
-                else:
-                    padding_width = 17 * cTB.get_ui_scale()
-                cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
-                col.alert = False
-
-                second_row = main_col.row(align=True)
-                splitrow = second_row.split(factor=0.7, align=True)
-                splitcol = splitrow.split(align=True)
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    icon=notice.icon or "NONE",
-                    text=str(notice.ac_update_ready_download_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_download_url,
-                    notice.ac_update_ready_download_label,
-                    notice.notification_id)
-                splitcol = splitrow.split(align=True)
-                ops = splitcol.operator(
-                    "poliigon.poliigon_link",
-                    text=str(notice.ac_update_ready_logs_label),
-                )
-                if notice.tooltip:
-                    ops.vTooltip = notice.tooltip
-                ops.vMode = build_mode(
-                    notice.ac_update_ready_logs_url,
-                    notice.ac_update_ready_logs_label,
-                    notice.notification_id)
-
-        elif notice.action == Notification.ActionType.POPUP_MESSAGE:
-            single_row_width = 250
-            if panel_width > single_row_width and len(notice.title) <= 80:
-                # Single row with text + button.
-                first_row.alert = notice.ac_popup_message_alert
-                first_row.label(text=notice.title)
-                first_row.alert = False
-                ops = first_row.operator(
-                    "poliigon.popup_message",
-                    icon=notice.icon or "NONE",
-                    text="View"
-                )
-
-            else:
-                # Two rows (or more, if text wrapping).
-                col = first_row.column(align=True)
-                col.alert = notice.ac_popup_message_alert
-                # Empirically found squaring worked best for 1 & 2x displays,
-                # which accounts for the box+panel padding and the 'x' button.
-                if notice.allow_dismiss:
-                    padding_width = 32 * cTB.get_ui_scale()
-                else:
-                    padding_width = 17 * cTB.get_ui_scale()
-                cTB.f_Label(cTB.vWidth - padding_width, notice.title, col)
-                col.alert = False
-
-                second_row = main_col.row(align=True)
-                second_row.scale_y = 1.0
-                ops = second_row.operator(
-                    "poliigon.popup_message",
-                    icon=notice.icon or "NONE",
-                    text="View",
-                )
-
-            ops.message_body = notice.ac_popup_message_body
-            ops.notice_id = notice.notification_id
-            if notice.tooltip:
-                ops.vTooltip = notice.tooltip
-            if notice.ac_popup_message_url:
-                ops.message_url = notice.ac_popup_message_url
-
-        elif notice.action == Notification.ActionType.RUN_OPERATOR:
-            # Single row with only a button.
-            ops = first_row.operator(
-                "poliigon.notice_operator",
-                text=notice.title,
-                icon=notice.icon or "NONE",
-            )
-            ops.notice_id = notice.notification_id
-            ops.ops_name = notice.ac_run_operator_ops_name
-            ops.vTooltip = notice.tooltip
-
-        else:
-            main_col.label(text=notice.title)
-            print("Invalid notifcation type")
+        draw_notice = _NOTICE_HANDLERS.get(notice.action, _draw_notice_invalid)
+        draw_notice(notice, first_row, main_col, banner)
 
         if notice.allow_dismiss:
             right_col = x_row.column(align=True)
@@ -2806,7 +3040,7 @@ class POLIIGON_MT_add_node_groups(bpy.types.Menu):
     def draw(self, context):
         layout = self.layout
         col = layout.column(align=True)
-        if bpy.app.version >= (2, 90):
+        if _SUPPORTS_MOSAIC:
             col.operator("poliigon.add_converter_node",
                          text="Mosaic"
                          ).node_type = "Mosaic_UV_Mapping"
@@ -2823,44 +3057,48 @@ class POLIIGON_MT_add_node_groups(bpy.types.Menu):
 
 
 def get_model_op_details(asset_name, asset_type, size):
-    """Get details to use in the ui for a given model and size."""
+    """Get details to use in the ui for a given model and size.
+
+    Memoized in cTB.model_op_details_cache until cTB.draw_cache_gen changes,
+    e.g. when a collection got added, removed or renamed
+    (see toolbox.f_depsgraph_handler()).
+    """
     default_lod = cTB.vSettings["lod"]
+    key = (asset_name, asset_type, size, default_lod)
+    generation = cTB.draw_cache_gen
+    details_cache = cTB.model_op_details_cache
+    entry = details_cache.get(key)
+    if entry is not None and entry[0] == generation:
+        details_cache.move_to_end(key)
+        return entry[1]
+
+    # Only snapshot the needed fields, while holding the lock
     with cTB.lock_assets:
         asset_data = cTB.vAssets["local"][asset_type][asset_name]
-    downloaded = asset_data["sizes"]
+        downloaded = tuple(asset_data["sizes"])
+        lods = tuple(asset_data["lods"])
 
-    if len(asset_data["lods"]):
-        lod = cTB.f_GetClosestLod(asset_data["lods"], default_lod)
-    else:
-        lod = ""
+    lod = cTB.f_GetClosestLod(lods, default_lod) if lods else ""
 
     coll_name = utils.construct_model_name(asset_name, size, lod)
 
-    coll = bpy.data.collections.get(coll_name)
-    if coll:
-        in_scene = True
-    else:
-        in_scene = False
+    in_scene = coll_name in cTB.get_collection_names()
 
     label = ""
     tip = ""
     if size in downloaded:
-        if in_scene:
-            if lod:
-                label = f"{size} {lod} (import again)"
-                tip = f"Import {size} {lod} again\n{asset_name}"
-            else:
-                label = f"{size} (import again)"
-                tip = f"Import {size} again\n{asset_name}"
-        else:
-            if lod:
-                label = f"{size} {lod} (import)"
-                tip = f"Import {size} {lod}\n{asset_name}"
-            else:
-                label = f"{size} (import)"
-                tip = f"Import {size}\n{asset_name}"
+        # E.g. "2K LOD1 (import again)" and "Import 2K LOD1 again"
+        lod_suffix = f" {lod}" if lod else ""
+        again = " again" if in_scene else ""
+        label = f"{size}{lod_suffix} (import{again})"
+        tip = f"Import {size}{lod_suffix}{again}\n{asset_name}"
 
-    return lod, label, tip
+    result = (lod, label, tip)
+    details_cache[key] = (generation, result)
+    details_cache.move_to_end(key)
+    while len(details_cache) > DRAW_CACHE_SIZE:
+        details_cache.popitem(last=False)
+    return result
 
 
 # .............................................................................
@@ -2874,8 +3112,9 @@ classes = (
 
 
 def register():
+    register_class = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        register_class(cls)
 
     bpy.types.NODE_MT_add.append(append_poliigon_groups_node_add)
 
@@ -2883,5 +3122,6 @@ def register():
 def unregister():
     bpy.types.NODE_MT_add.remove(append_poliigon_groups_node_add)
 
+    unregister_class = bpy.utils.unregister_class
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+        unregister_class(cls)
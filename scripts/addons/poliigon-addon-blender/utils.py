@@ -16,6 +16,7 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+from functools import lru_cache
 import os
 import subprocess
 import time
@@ -71,8 +72,12 @@ def timer(fn):
     return wrapper
 
 
+@lru_cache(maxsize=4096)
 def construct_model_name(asset_name, size, lod):
-    """Constructs the model name from the given inputs."""
+    """Constructs the model name from the given inputs.
+
+    Cached, as it gets called from UI draw code.
+    """
     if lod:
         model_name = f"{asset_name}_{size}_{lod}"
     else: